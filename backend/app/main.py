@@ -6,12 +6,14 @@ from .routes.products import router as products_router
 from .database import engine, Base
 from .config import get_settings
 from .backup import create_backup
+from .migrations import run_migrations
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
-# Create database tables
+# Create database tables and upgrade existing databases
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 
 
 @asynccontextmanager
@@ -0,0 +1,92 @@
+"""
+Lightweight schema migrations for existing inventory.db files
+create_all() only creates missing tables, so new columns are added here.
+"""
+import logging
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from .services.search_text import build_search_document, SEARCH_FIELDS
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def add_search_document_column(engine: Engine):
+    """Add products.search_document if this database predates it"""
+    columns = {column["name"] for column in inspect(engine).get_columns("products")}
+    if "search_document" in columns:
+        return False
+
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE products ADD COLUMN search_document TEXT"))
+    logger.info("Added search_document column to products table")
+    return True
+
+
+def backfill_search_documents(engine: Engine, rebuild: bool = False):
+    """
+    Compute search_document for every product that does not have one yet
+    rebuild: recompute every row (used when the document format changes)
+    """
+    missing_only = "" if rebuild else "search_document IS NULL AND "
+    select_sql = text(
+        f"SELECT id, {', '.join(SEARCH_FIELDS)} FROM products "
+        f"WHERE {missing_only}id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update_sql = text("UPDATE products SET search_document = :document WHERE id = :id")
+
+    updated = 0
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(select_sql, {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}).all()
+            if not rows:
+                break
+            conn.execute(update_sql, [
+                {"id": row.id, "document": build_search_document(row)} for row in rows
+            ])
+        updated += len(rows)
+        last_id = rows[-1].id
+
+    if updated:
+        logger.info(f"Backfilled search_document for {updated} products")
+    return updated
+
+
+def rebuild_search_documents(engine: Engine):
+    """Recompute every search_document after its format has changed"""
+    backfill_search_documents(engine, rebuild=True)
+
+
+# Ordered schema upgrades. The database-wide schema version is kept in SQLite's
+# PRAGMA user_version; each step runs once, on databases below its version.
+SCHEMA_STEPS = (
+    (1, rebuild_search_documents),  # search_document fields separated by " | "
+    (2, rebuild_search_documents),  # search_document keeps a slot for every field
+)
+SCHEMA_VERSION = SCHEMA_STEPS[-1][0]
+
+
+def get_schema_version(engine: Engine) -> int:
+    """Schema version recorded in SQLite's user_version pragma"""
+    with engine.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def set_schema_version(engine: Engine, version: int):
+    with engine.begin() as conn:
+        conn.execute(text(f"PRAGMA user_version = {int(version)}"))
+
+
+def run_migrations(engine: Engine):
+    """Bring an existing database up to the current schema"""
+    add_search_document_column(engine)
+    backfill_search_documents(engine)
+
+    current = get_schema_version(engine)
+    for version, step in SCHEMA_STEPS:
+        if current < version:
+            step(engine)
+            set_schema_version(engine, version)
+            logger.info(f"Database schema upgraded to version {version}")
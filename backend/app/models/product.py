@@ -16,5 +16,6 @@ class Product(Base):
     shelf_location = Column(String(100), nullable=True)
     price = Column(DECIMAL(10, 2), nullable=True)
     description = Column(Text, nullable=True)
+    search_document = Column(Text, nullable=True)  # Normalized search text, maintained on write
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
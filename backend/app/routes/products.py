@@ -5,14 +5,43 @@ from ..database import get_db
 from ..models.product import Product
 from ..schemas.product import ProductCreate, ProductUpdate, ProductResponse
 from ..services.semantic_search import SmartSearch
+from ..services.catalog import get_catalog, catalog, paginate, materialize
+from ..services.search_text import build_search_document
 
 router = APIRouter(prefix="/products", tags=["products"])
 
+SORT_PATTERN = "^(id|name|price|stock)$"
+
+
+def _select_page(
+    db: Session,
+    entries: Optional[list],
+    category: Optional[str],
+    brand: Optional[str],
+    in_stock: Optional[bool],
+    sort_by: Optional[str],
+    descending: bool,
+    skip: int,
+    limit: Optional[int],
+) -> list:
+    """Filter, sort and paginate against the catalogue, then load only the page"""
+    product_catalog = get_catalog(db)
+    ids = product_catalog.filter_ids(entries, category=category, brand=brand, in_stock=in_stock)
+    ids = product_catalog.sort_ids(ids, sort_by, descending)
+    return materialize(db, paginate(ids, skip, limit))
+
 
 @router.get("/search", response_model=List[ProductResponse])
 def search_products(
     query: Optional[str] = Query(None),
     use_smart: bool = Query(default=True, description="Use smart keyword understanding"),
+    category: Optional[str] = Query(None, description="Only products in this category"),
+    brand: Optional[str] = Query(None, description="Only products of this brand"),
+    in_stock: Optional[bool] = Query(None, description="Filter by stock availability"),
+    sort_by: Optional[str] = Query(None, pattern=SORT_PATTERN, description="id, name, price or stock"),
+    descending: bool = Query(default=False, description="Reverse sort_by order; ignored without sort_by"),
+    skip: int = Query(default=0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     """
@@ -21,38 +50,38 @@ def search_products(
     - If query is empty, returns all products
     - use_smart=true: Understands synonyms (stopping = brake, motor = engine)
     - use_smart=false: Traditional exact keyword matching
+    - Results are ranked by relevance unless sort_by is given
     """
-    # Get all products from database
-    all_products = db.query(Product).all()
+    product_catalog = get_catalog(db)
     
     if not query or not query.strip():
-        return all_products
-    
-    if use_smart and all_products:
+        entries = None
+    elif use_smart:
         # Use smart keyword expansion
         smart_search = SmartSearch()
-        products = smart_search.search(query, all_products)
-        return products
+        entries = smart_search.search(query, product_catalog.entries())
     else:
-        # Traditional SQL LIKE search (fallback)
-        search_term = f"%{query}%"
-        products = db.query(Product).filter(
-            (Product.product_name.like(search_term)) |
-            (Product.part_number.like(search_term)) |
-            (Product.bike_models.like(search_term)) |
-            (Product.brand.like(search_term)) |
-            (Product.category.like(search_term))
-        ).all()
-        
-        return products
+        # Traditional substring search over the stored search text (fallback)
+        entries = product_catalog.text_search(db, query)
+    
+    return _select_page(db, entries, category, brand, in_stock, sort_by, descending, skip, limit)
 
 
 @router.get("", response_model=List[ProductResponse])
-def get_all_products(db: Session = Depends(get_db)):
+def get_all_products(
+    category: Optional[str] = Query(None),
+    brand: Optional[str] = Query(None),
+    in_stock: Optional[bool] = Query(None),
+    sort_by: Optional[str] = Query(None, pattern=SORT_PATTERN),
+    descending: bool = Query(default=False, description="Reverse sort_by order; ignored without sort_by"),
+    skip: int = Query(default=0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
     """
     Get all products in inventory
     """
-    return db.query(Product).all()
+    return _select_page(db, None, category, brand, in_stock, sort_by, descending, skip, limit)
 
 
 @router.get("/by-bike", response_model=List[ProductResponse])
@@ -63,12 +92,8 @@ def get_parts_by_bike(
     """
     Find all parts compatible with a specific bike model
     """
-    search_term = f"%{model}%"
-    products = db.query(Product).filter(
-        Product.bike_models.like(search_term)
-    ).all()
-    
-    return products
+    entries = get_catalog(db).like_search(db, model, (Product.bike_models,))
+    return materialize(db, [entry.id for entry in entries])
 
 
 @router.get("/by-part-number", response_model=List[ProductResponse])
@@ -79,12 +104,8 @@ def search_by_part_number(
     """
     Search products by part number
     """
-    search_term = f"%{part_number}%"
-    products = db.query(Product).filter(
-        Product.part_number.like(search_term)
-    ).all()
-    
-    return products
+    entries = get_catalog(db).like_search(db, part_number, (Product.part_number,))
+    return materialize(db, [entry.id for entry in entries])
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
@@ -104,9 +125,11 @@ def create_product(product: ProductCreate, db: Session = Depends(get_db)):
     Create a new product
     """
     db_product = Product(**product.model_dump())
+    db_product.search_document = build_search_document(db_product)
     db.add(db_product)
     db.commit()
     db.refresh(db_product)
+    catalog.sync(db, db_product.id)
     return db_product
 
 
@@ -126,9 +149,11 @@ def update_product(
     update_data = product.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_product, key, value)
+    db_product.search_document = build_search_document(db_product)
     
     db.commit()
     db.refresh(db_product)
+    catalog.sync(db, db_product.id)
     return db_product
 
 
@@ -143,4 +168,5 @@ def delete_product(product_id: int, db: Session = Depends(get_db)):
     
     db.delete(db_product)
     db.commit()
+    catalog.sync(db, product_id)
     return None
@@ -0,0 +1,342 @@
+# Process-wide columnar product catalogue
+# Keeps a compact copy of the searchable columns in memory so search, filtering
+# and sorting never have to load full ORM objects. Only the final page of
+# results is fetched from the database, as plain table rows.
+
+import bisect
+import math
+import sys
+import threading
+from array import array
+
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session
+
+from ..models.product import Product
+from .search_text import normalize_text, build_search_document, document_field
+
+SORT_FIELDS = ("id", "name", "price", "stock")
+
+# Columns the original SQL LIKE search looked at
+LIKE_COLUMNS = (
+    Product.product_name,
+    Product.part_number,
+    Product.bike_models,
+    Product.brand,
+    Product.category,
+)
+
+# Columns the catalogue is built from (plain tuples, no ORM instances)
+_CATALOG_COLUMNS = (
+    Product.id,
+    Product.product_name,
+    Product.part_number,
+    Product.bike_models,
+    Product.category,
+    Product.brand,
+    Product.description,
+    Product.search_document,
+    Product.stock_quantity,
+    Product.price,
+)
+
+# Columns returned to the API (ProductResponse reads them by attribute)
+_RESPONSE_COLUMNS = tuple(
+    column for column in Product.__table__.columns if column.name != "search_document"
+)
+
+# Ids per "id IN (...)" query, kept below SQLite's bound-parameter limit
+_MATERIALIZE_CHUNK = 500
+
+
+class CatalogEntry:
+    """
+    Lightweight text record for one product (no ORM state)
+    Name, part number and bike models are not stored separately - their
+    normalized text is read back from search_document when needed.
+    """
+
+    __slots__ = ("id", "category", "brand", "search_document")
+
+    def __init__(self, product_id, category, brand, search_document):
+        self.id = product_id
+        self.category = category
+        self.brand = brand
+        self.search_document = search_document
+
+
+def _intern(value):
+    """Intern repeated short strings (brand, category) so rows share them"""
+    return sys.intern(value) if value else value
+
+
+def _search_document(product) -> str:
+    """Stored search text; rebuilt only when the column was never filled"""
+    if product.search_document is None:
+        return build_search_document(product)
+    return product.search_document
+
+
+def _entry_from(product) -> CatalogEntry:
+    return CatalogEntry(
+        product.id,
+        _intern(product.category),
+        _intern(product.brand),
+        _search_document(product),
+    )
+
+
+def _price_to_float(price) -> float:
+    """Store price as a double for sorting; missing prices become NaN"""
+    return float(price) if price is not None else math.nan
+
+
+class ProductCatalog:
+    """
+    Columnar in-memory view of the products table
+
+    Rows are kept in id order. Numeric columns live in packed arrays and text
+    columns in __slots__ records, all indexed by the same position.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._ids = array("q")
+        self._stock = array("q")
+        self._price = array("d")
+        self._entries = []
+        # id -> position lookup for bulk reads; rebuilt lazily after a write
+        # shifts positions, while single-id lookups bisect the sorted ids
+        self._positions = {}
+        self._positions_stale = False
+
+    # ------------------------------------------------------------------
+    # Loading and write-through sync
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self, db: Session):
+        """Load the catalogue from the database on first use"""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load(db)
+
+    def reload(self, db: Session):
+        """Discard the in-memory copy and reload it from the database"""
+        with self._lock:
+            self._load(db)
+
+    def _load(self, db: Session):
+        ids = array("q")
+        stock = array("q")
+        price = array("d")
+        entries = []
+
+        # Plain column tuples, streamed - never full Product instances
+        rows = db.query(*_CATALOG_COLUMNS).order_by(Product.id).yield_per(1000)
+
+        for row in rows:
+            ids.append(row.id)
+            stock.append(row.stock_quantity or 0)
+            price.append(_price_to_float(row.price))
+            entries.append(_entry_from(row))
+
+        self._ids = ids
+        self._stock = stock
+        self._price = price
+        self._entries = entries
+        self._positions = {product_id: pos for pos, product_id in enumerate(ids)}
+        self._positions_stale = False
+        self._loaded = True
+
+    def sync(self, db: Session, product_id: int):
+        """
+        Bring one product in line with the database after a commit
+        The row is re-read under the lock, so when writers race on the same id
+        the last sync always applies the latest committed state.
+        """
+        with self._lock:
+            if not self._loaded:
+                return
+            row = db.query(*_CATALOG_COLUMNS).filter(Product.id == product_id).first()
+            if row is None:
+                self.remove(product_id)
+            else:
+                self.upsert(row)
+
+    def upsert(self, product):
+        """Insert or refresh a product (ORM instance or catalogue column row)"""
+        with self._lock:
+            if not self._loaded:
+                return
+            entry = _entry_from(product)
+            pos = self._position(product.id)
+            if pos is None:
+                pos = bisect.bisect_left(self._ids, product.id)
+                if pos == len(self._ids):
+                    # New ids are normally the largest, so this is an append
+                    if not self._positions_stale:
+                        self._positions[product.id] = pos
+                else:
+                    # Out-of-order id (e.g. explicit id) shifts later rows
+                    self._positions_stale = True
+                self._ids.insert(pos, product.id)
+                self._stock.insert(pos, 0)
+                self._price.insert(pos, math.nan)
+                self._entries.insert(pos, entry)
+            else:
+                self._entries[pos] = entry
+            self._stock[pos] = product.stock_quantity or 0
+            self._price[pos] = _price_to_float(product.price)
+
+    def remove(self, product_id: int):
+        """Drop a product after it has been deleted"""
+        with self._lock:
+            pos = self._position(product_id)
+            if pos is None:
+                return
+            del self._ids[pos]
+            del self._stock[pos]
+            del self._price[pos]
+            del self._entries[pos]
+            self._positions_stale = True
+
+    def _position(self, product_id: int):
+        """Position of one id, found by bisecting the sorted id array"""
+        pos = bisect.bisect_left(self._ids, product_id)
+        if pos < len(self._ids) and self._ids[pos] == product_id:
+            return pos
+        return None
+
+    def _position_map(self) -> dict:
+        """id -> position for every row, rebuilt only if writes shifted rows"""
+        if self._positions_stale:
+            self._positions = {product_id: pos for pos, product_id in enumerate(self._ids)}
+            self._positions_stale = False
+        return self._positions
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self._ids)
+
+    def entries(self) -> list:
+        """Snapshot of the text records, in id order"""
+        with self._lock:
+            return list(self._entries)
+
+    def filter_ids(self, entries=None, category: str = None, brand: str = None,
+                   in_stock: bool = None) -> list:
+        """
+        Apply exact-match filters
+        entries: optional pre-selected records (e.g. search results) to narrow
+        """
+        with self._lock:
+            if entries is None:
+                entries = self._entries
+            category = category.lower() if category else None
+            brand = brand.lower() if brand else None
+            positions = self._position_map()
+            stock = self._stock
+
+            result = []
+            for entry in entries:
+                if entry.id not in positions:
+                    # Deleted since the caller took its snapshot
+                    continue
+                if category and (entry.category or "").lower() != category:
+                    continue
+                if brand and (entry.brand or "").lower() != brand:
+                    continue
+                if in_stock is not None:
+                    available = stock[positions[entry.id]] > 0
+                    if available != in_stock:
+                        continue
+                result.append(entry.id)
+            return result
+
+    def text_search(self, db: Session, query: str) -> list:
+        """Substring match of the normalized query against each search document"""
+        term = normalize_text(query)
+        if not term:
+            # Punctuation-only query (e.g. "-"): match the raw columns instead
+            return self.like_search(db, query, LIKE_COLUMNS)
+        with self._lock:
+            return [entry for entry in self._entries if term in entry.search_document]
+
+    def like_search(self, db: Session, term: str, columns: tuple) -> list:
+        """
+        SQL LIKE %term% on raw columns
+        Only matching ids are read from the database; records come from here.
+        """
+        pattern = f"%{term}%"
+        ids = db.execute(
+            select(Product.id).where(or_(*(column.like(pattern) for column in columns)))
+        ).scalars().all()
+        with self._lock:
+            positions = self._position_map()
+            found = sorted(positions[i] for i in ids if i in positions)
+            return [self._entries[pos] for pos in found]
+
+    def sort_ids(self, ids: list, sort_by: str = None, descending: bool = False) -> list:
+        """
+        Sort ids by a catalogue column; missing prices always sort last
+        Without sort_by the incoming order (e.g. relevance) is kept as is.
+        """
+        if not sort_by:
+            return ids
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field: {sort_by}")
+
+        with self._lock:
+            positions = self._position_map()
+            if sort_by == "id":
+                key = None
+            elif sort_by == "name":
+                entries = self._entries
+                key = lambda i: document_field(entries[positions[i]].search_document, "product_name")
+            elif sort_by == "stock":
+                stock = self._stock
+                key = lambda i: stock[positions[i]]
+            else:
+                price = self._price
+                priced = [i for i in ids if not math.isnan(price[positions[i]])]
+                unpriced = [i for i in ids if math.isnan(price[positions[i]])]
+                priced.sort(key=lambda i: price[positions[i]], reverse=descending)
+                return priced + unpriced
+
+            return sorted(ids, key=key, reverse=descending)
+
+
+def paginate(ids: list, skip: int = 0, limit: int = None) -> list:
+    """Slice a list of ids down to the requested page"""
+    if limit is None:
+        return ids[skip:]
+    return ids[skip:skip + limit]
+
+
+def materialize(db: Session, ids: list) -> list:
+    """
+    Fetch the response rows for the given ids, preserving their order
+    Returns plain table rows rather than Product instances - no identity map
+    or instance state, and only the requested ids are ever read.
+    """
+    by_id = {}
+    for start in range(0, len(ids), _MATERIALIZE_CHUNK):
+        chunk = ids[start:start + _MATERIALIZE_CHUNK]
+        for row in db.execute(select(*_RESPONSE_COLUMNS).where(Product.id.in_(chunk))):
+            by_id[row.id] = row
+    return [by_id[i] for i in ids if i in by_id]
+
+
+catalog = ProductCatalog()
+
+
+def get_catalog(db: Session) -> ProductCatalog:
+    """Return the shared catalogue, loading it on first use"""
+    catalog.ensure_loaded(db)
+    return catalog
@@ -0,0 +1,51 @@
+# Normalized search text shared by both search modes
+# Each product stores one precomputed "search document" so queries only have
+# to scan a single lowercase string instead of re-joining columns every time.
+
+import re
+import unicodedata
+
+# Columns that make up the search document, in order
+SEARCH_FIELDS = (
+    "product_name",
+    "part_number",
+    "bike_models",
+    "category",
+    "brand",
+    "description",
+)
+
+# Placed between fields so a phrase cannot match across two of them;
+# normalize_text() never emits "|"
+FIELD_SEPARATOR = " | "
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase, strip accents and punctuation, collapse whitespace
+    Example: "Brémbo Disc-Pad (Front)" -> "brembo disc pad front"
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(_NON_WORD.sub(" ", stripped.casefold()).split())
+
+
+def build_search_document(product) -> str:
+    """
+    Build the normalized search document for a product-like object
+    Every field keeps its slot (empty ones included), in SEARCH_FIELDS order.
+    Example: "Brake pad", None, "Pulsar 150", ... -> "brake pad |  | pulsar 150 | ..."
+    Changing the format needs a rebuild step in app/migrations.py
+    """
+    return FIELD_SEPARATOR.join(
+        normalize_text(getattr(product, field)) for field in SEARCH_FIELDS
+    )
+
+
+def document_field(document: str, field: str) -> str:
+    """Read one field's normalized text back out of a search document"""
+    return document.split(FIELD_SEPARATOR)[SEARCH_FIELDS.index(field)]
@@ -1,6 +1,8 @@
 # Simple keyword understanding without heavy ML models
 # Maps user queries to actual product keywords
 
+from .search_text import normalize_text, build_search_document
+
 KEYWORD_SYNONYMS = {
     # Brake related
     "stopping": ["brake", "braking"],
@@ -32,7 +34,7 @@ class SmartSearch:
         Expand user query with synonyms
         Example: "stopping parts" -> ["stopping", "brake", "braking", "parts"]
         """
-        words = query.lower().split()
+        words = normalize_text(query).split()
         expanded = set(words)  # Start with original words
         
         for word in words:
@@ -63,14 +65,11 @@ class SmartSearch:
     def calculate_match_score(self, product, keywords: list) -> int:
         """Calculate how well a product matches the keywords"""
         score = 0
-        product_text = " ".join([
-            product.product_name or "",
-            product.part_number or "",
-            product.bike_models or "",
-            product.category or "",
-            product.brand or "",
-            product.description or ""
-        ]).lower()
+        # Precomputed on write (may legitimately be empty); only rebuilt for
+        # rows that predate the column
+        product_text = product.search_document
+        if product_text is None:
+            product_text = build_search_document(product)
         
         for keyword in keywords:
             if keyword in product_text:
@@ -0,0 +1,135 @@
+"""
+Memory/time benchmark: ORM object lists vs the columnar product catalogue
+Builds a throwaway SQLite database and compares requests done the old way
+(load every Product, then score/return) with the catalogue path (score and
+filter in-memory records, then materialize only the returned rows).
+
+Unpaged rows are what the bundled frontend requests today (it never sends
+limit), so both paths return the same rows there. Paged rows show the
+saving when a client passes limit.
+
+Usage: python benchmark_catalog.py [product_count] [page_size]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Point the app at a temporary database before anything imports it
+_tmp_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_tmp_dir, 'bench.db').as_posix()}"
+
+from app.database import engine, Base, SessionLocal  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.migrations import backfill_search_documents  # noqa: E402
+from app.services.semantic_search import SmartSearch  # noqa: E402
+from app.services.catalog import ProductCatalog, paginate, materialize  # noqa: E402
+
+BRANDS = ["Bosch", "Honda", "Bajaj", "TVS", "Hero", "Yamaha", "Minda", "Lumax"]
+CATEGORIES = ["Brake", "Engine", "Electrical", "Suspension", "Body", "Tyre"]
+BIKES = ["Splendor", "Pulsar 150", "Apache RTR", "Activa", "FZ", "Passion Pro"]
+
+
+def seed(count: int):
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(Product, [
+            {
+                "product_name": f"{CATEGORIES[i % 6]} part {i}",
+                "part_number": f"PN-{i:07d}",
+                "bike_models": f"{BIKES[i % 6]}, {BIKES[(i + 1) % 6]}",
+                "category": CATEGORIES[i % 6],
+                "brand": BRANDS[i % 8],
+                "stock_quantity": i % 50,
+                "shelf_location": f"R{i % 20}-S{i % 7}",
+                "price": (i % 5000) / 10,
+                "description": f"Replacement {CATEGORIES[i % 6].lower()} component number {i}",
+            }
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+    backfill_search_documents(engine)
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    # retained: still allocated while the result is alive (e.g. catalogue size)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<38} {elapsed * 1000:9.1f} ms  peak {peak / 1024 / 1024:8.1f} MB  "
+          f"retained {retained / 1024 / 1024:6.1f} MB  ({len(result)} rows)")
+    return result
+
+
+def orm_search(query: str):
+    db = SessionLocal()
+    try:
+        return SmartSearch().search(query, db.query(Product).all())
+    finally:
+        db.close()
+
+
+def orm_list():
+    db = SessionLocal()
+    try:
+        return db.query(Product).all()
+    finally:
+        db.close()
+
+
+def catalog_search(product_catalog: ProductCatalog, query: str, limit: int = None):
+    db = SessionLocal()
+    try:
+        entries = SmartSearch().search(query, product_catalog.entries())
+        ids = product_catalog.filter_ids(entries)
+        return materialize(db, paginate(ids, 0, limit))
+    finally:
+        db.close()
+
+
+def catalog_list(product_catalog: ProductCatalog, limit: int = None):
+    db = SessionLocal()
+    try:
+        return materialize(db, paginate(product_catalog.filter_ids(), 0, limit))
+    finally:
+        db.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    query = "stopping pulsar"
+
+    print(f"Seeding {count} products...")
+    seed(count)
+
+    product_catalog = ProductCatalog()
+    db = SessionLocal()
+    try:
+        measure("catalogue load (one-off)", lambda: product_catalog.reload(db) or product_catalog)
+    finally:
+        db.close()
+
+    print("\nSearch (unpaged, same rows returned)")
+    measure("  ORM list", lambda: orm_search(query))
+    measure("  catalogue", lambda: catalog_search(product_catalog, query))
+
+    print("\nList all (unpaged, same rows returned)")
+    measure("  ORM list", orm_list)
+    measure("  catalogue", lambda: catalog_list(product_catalog))
+
+    print(f"\nPaged (limit={page_size}) - catalogue only; the old routes could not page")
+    measure("  search", lambda: catalog_search(product_catalog, query, page_size))
+    measure("  list", lambda: catalog_list(product_catalog, page_size))
+
+
+if __name__ == "__main__":
+    main()
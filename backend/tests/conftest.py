@@ -0,0 +1,33 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Point the app at a throwaway database before anything imports it
+_tmp_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_tmp_dir, 'test.db').as_posix()}"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from app.main import app  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.services.catalog import catalog  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """Empty products table and a freshly loaded shared catalogue"""
+    session = SessionLocal()
+    session.query(Product).delete()
+    session.commit()
+    catalog.reload(session)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    return TestClient(app)
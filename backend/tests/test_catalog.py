@@ -0,0 +1,203 @@
+from types import SimpleNamespace
+
+from app.models.product import Product
+from app.services.catalog import ProductCatalog
+
+
+def make_row(product_id, name="Part", category=None, brand=None, stock=0, price=None):
+    return SimpleNamespace(
+        id=product_id,
+        product_name=name,
+        part_number=None,
+        bike_models=None,
+        category=category,
+        brand=brand,
+        description=None,
+        search_document=None,
+        stock_quantity=stock,
+        price=price,
+    )
+
+
+def make_catalog(db, *rows):
+    product_catalog = ProductCatalog()
+    product_catalog.reload(db)
+    for row in rows:
+        product_catalog.upsert(row)
+    return product_catalog
+
+
+def names(response):
+    assert response.status_code == 200
+    return [product["product_name"] for product in response.json()]
+
+
+# ----------------------------------------------------------------------
+# ProductCatalog
+# ----------------------------------------------------------------------
+
+def test_out_of_order_upsert_keeps_id_order(db):
+    product_catalog = make_catalog(db, make_row(1, stock=1), make_row(5, stock=5), make_row(3, stock=3))
+
+    assert product_catalog.filter_ids() == [1, 3, 5]
+    assert product_catalog.sort_ids([5, 3, 1], "stock") == [1, 3, 5]
+
+
+def test_upsert_existing_id_updates_in_place(db):
+    product_catalog = make_catalog(db, make_row(1, stock=0), make_row(2, stock=0))
+    product_catalog.upsert(make_row(1, stock=4))
+
+    assert len(product_catalog) == 2
+    assert product_catalog.filter_ids(in_stock=True) == [1]
+
+
+def test_remove_reindexes_following_rows(db):
+    product_catalog = make_catalog(
+        db, make_row(1, stock=0), make_row(2, stock=7), make_row(3, stock=0),
+    )
+    product_catalog.remove(1)
+    product_catalog.upsert(make_row(3, stock=2))
+
+    assert product_catalog.filter_ids() == [2, 3]
+    assert product_catalog.filter_ids(in_stock=True) == [2, 3]
+    assert product_catalog.sort_ids([2, 3], "stock") == [3, 2]
+    product_catalog.remove(42)  # unknown ids are ignored
+    assert len(product_catalog) == 2
+
+
+def test_missing_prices_sort_last_in_both_directions(db):
+    product_catalog = make_catalog(
+        db, make_row(1, price=None), make_row(2, price=5), make_row(3, price=20),
+    )
+
+    assert product_catalog.sort_ids([1, 2, 3], "price") == [2, 3, 1]
+    assert product_catalog.sort_ids([1, 2, 3], "price", descending=True) == [3, 2, 1]
+
+
+def test_filter_ids_skips_entries_deleted_after_snapshot(db):
+    product_catalog = make_catalog(db, make_row(1), make_row(2), make_row(3))
+    snapshot = product_catalog.entries()
+    product_catalog.remove(2)
+
+    assert product_catalog.filter_ids(snapshot) == [1, 3]
+
+
+def test_sync_applies_latest_committed_row(db):
+    product = Product(product_name="Brake pad", stock_quantity=0)
+    db.add(product)
+    db.commit()
+    product_catalog = make_catalog(db)
+    product_catalog.sync(db, product.id)
+
+    # Another writer commits newer state; a late sync must pick it up
+    db.query(Product).filter(Product.id == product.id).update({"stock_quantity": 6})
+    db.commit()
+    product_catalog.sync(db, product.id)
+    assert product_catalog.filter_ids(in_stock=True) == [product.id]
+
+    db.query(Product).filter(Product.id == product.id).delete()
+    db.commit()
+    product_catalog.sync(db, product.id)
+    assert len(product_catalog) == 0
+
+
+def test_filters_are_case_insensitive(db):
+    product_catalog = make_catalog(
+        db,
+        make_row(1, category="Brake", brand="Bosch"),
+        make_row(2, category="Engine", brand="Bosch"),
+        make_row(3, category="Brake", brand="Honda"),
+    )
+
+    assert product_catalog.filter_ids(category="brake") == [1, 3]
+    assert product_catalog.filter_ids(category="BRAKE", brand="bosch") == [1]
+
+
+# ----------------------------------------------------------------------
+# Route parameters
+# ----------------------------------------------------------------------
+
+def seed(client):
+    products = [
+        {"product_name": "Brake pad", "category": "Brake", "brand": "Bosch", "stock_quantity": 5, "price": "12.50"},
+        {"product_name": "Engine oil", "category": "Engine", "brand": "Motul", "stock_quantity": 0, "price": "8.00"},
+        {"product_name": "Brake lever", "category": "Brake", "brand": "Honda", "stock_quantity": 2},
+        {"product_name": "Air filter", "category": "Engine", "brand": "Bosch", "stock_quantity": 9, "price": "4.25"},
+    ]
+    for product in products:
+        assert client.post("/products", json=product).status_code == 201
+
+
+def test_list_defaults_to_every_product_in_id_order(client):
+    seed(client)
+
+    assert names(client.get("/products")) == ["Brake pad", "Engine oil", "Brake lever", "Air filter"]
+
+
+def test_list_filters(client):
+    seed(client)
+
+    assert names(client.get("/products", params={"category": "brake"})) == ["Brake pad", "Brake lever"]
+    assert names(client.get("/products", params={"brand": "Bosch"})) == ["Brake pad", "Air filter"]
+    assert names(client.get("/products", params={"in_stock": "false"})) == ["Engine oil"]
+
+
+def test_list_sorting(client):
+    seed(client)
+
+    assert names(client.get("/products", params={"sort_by": "name"})) == [
+        "Air filter", "Brake lever", "Brake pad", "Engine oil",
+    ]
+    assert names(client.get("/products", params={"sort_by": "price", "descending": "true"})) == [
+        "Brake pad", "Engine oil", "Air filter", "Brake lever",
+    ]
+    assert names(client.get("/products", params={"sort_by": "stock", "descending": "true"})) == [
+        "Air filter", "Brake pad", "Brake lever", "Engine oil",
+    ]
+
+
+def test_descending_without_sort_by_keeps_relevance_order(client):
+    client.post("/products", json={"product_name": "Brake pad", "category": "Brake"})
+    client.post("/products", json={"product_name": "Spare bolt"})
+    client.post("/products", json={"product_name": "Brake disc", "description": "stopping power"})
+
+    params = {"query": "stopping"}
+    ranked = names(client.get("/products/search", params=params))
+    assert ranked[0] == "Brake disc"
+    assert names(client.get("/products/search", params={**params, "descending": "true"})) == ranked
+
+
+def test_list_skip_and_limit(client):
+    seed(client)
+
+    assert names(client.get("/products", params={"skip": 1, "limit": 2})) == ["Engine oil", "Brake lever"]
+    assert names(client.get("/products", params={"skip": 10})) == []
+
+
+def test_invalid_parameters_are_rejected(client):
+    assert client.get("/products", params={"sort_by": "colour"}).status_code == 422
+    assert client.get("/products", params={"limit": 0}).status_code == 422
+    assert client.get("/products", params={"skip": -1}).status_code == 422
+
+
+def test_search_combines_ranking_with_filters_and_paging(client):
+    seed(client)
+
+    params = {"query": "stopping", "in_stock": "true"}
+    assert names(client.get("/products/search", params=params)) == ["Brake pad", "Brake lever"]
+    params.update(sort_by="stock", limit=1)
+    assert names(client.get("/products/search", params=params)) == ["Brake lever"]
+    assert names(client.get("/products/search", params={"brand": "bosch", "sort_by": "price"})) == [
+        "Air filter", "Brake pad",
+    ]
+
+
+def test_writes_keep_catalogue_in_sync(client):
+    seed(client)
+
+    assert client.put("/products/2", json={"stock_quantity": 3}).status_code == 200
+    assert client.delete("/products/1").status_code == 204
+
+    assert names(client.get("/products", params={"in_stock": "true", "sort_by": "stock"})) == [
+        "Brake lever", "Engine oil", "Air filter",
+    ]
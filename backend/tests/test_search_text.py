@@ -0,0 +1,157 @@
+import sqlite3
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.migrations import run_migrations, get_schema_version, SCHEMA_VERSION
+from app.models.product import Product
+from app.services.search_text import (
+    FIELD_SEPARATOR,
+    build_search_document,
+    document_field,
+    normalize_text,
+)
+
+LEGACY_SCHEMA = """
+CREATE TABLE products (
+    id INTEGER PRIMARY KEY,
+    product_name VARCHAR(255) NOT NULL,
+    part_number VARCHAR(100),
+    bike_models TEXT,
+    category VARCHAR(100),
+    brand VARCHAR(100),
+    stock_quantity INTEGER,
+    shelf_location VARCHAR(100),
+    price NUMERIC(10, 2),
+    description TEXT,
+    created_at DATETIME,
+    updated_at DATETIME
+)
+"""
+
+
+def make_product(**fields):
+    values = {
+        "product_name": None,
+        "part_number": None,
+        "bike_models": None,
+        "category": None,
+        "brand": None,
+        "description": None,
+    }
+    values.update(fields)
+    return SimpleNamespace(**values)
+
+
+def names(response):
+    assert response.status_code == 200
+    return [product["product_name"] for product in response.json()]
+
+
+# ----------------------------------------------------------------------
+# Normalization
+# ----------------------------------------------------------------------
+
+def test_normalize_text_strips_accents_punctuation_and_case():
+    assert normalize_text("Brémbo Disc-Pad (Front)") == "brembo disc pad front"
+    assert normalize_text("  ÜBER__Straße!!  ") == "uber strasse"
+    assert normalize_text("PN-001/A") == "pn 001 a"
+
+
+def test_normalize_text_handles_empty_values():
+    assert normalize_text(None) == ""
+    assert normalize_text("") == ""
+    assert normalize_text("---") == ""
+
+
+def test_search_document_keeps_a_slot_per_field():
+    product = make_product(product_name="Disc-Pad", bike_models="Pulsar 150", category="Brake")
+    document = build_search_document(product)
+
+    assert document == FIELD_SEPARATOR.join(["disc pad", "", "pulsar 150", "brake", "", ""])
+    assert document_field(document, "product_name") == "disc pad"
+    assert document_field(document, "bike_models") == "pulsar 150"
+    assert document_field(document, "part_number") == ""
+
+
+def test_search_document_separator_blocks_cross_field_matches():
+    document = build_search_document(make_product(product_name="Lever", bike_models="Pulsar 150", category="Brake"))
+
+    assert normalize_text("pulsar 150") in document
+    assert normalize_text("pulsar 150 brake") not in document
+
+
+# ----------------------------------------------------------------------
+# Migration
+# ----------------------------------------------------------------------
+
+def test_run_migrations_upgrades_legacy_database(tmp_path):
+    db_file = tmp_path / "legacy.db"
+    with sqlite3.connect(db_file) as conn:
+        conn.execute(LEGACY_SCHEMA)
+        conn.executemany(
+            "INSERT INTO products (product_name, part_number, category) VALUES (?, ?, ?)",
+            [("Brémbo Pad", "PN-001", "Brake"), ("Engine Oil", None, "Engine")],
+        )
+    engine = create_engine(f"sqlite:///{db_file.as_posix()}")
+
+    run_migrations(engine)
+
+    columns = {column["name"] for column in inspect(engine).get_columns("products")}
+    assert "search_document" in columns
+    assert get_schema_version(engine) == SCHEMA_VERSION
+    with engine.connect() as conn:
+        documents = conn.execute(text("SELECT search_document FROM products ORDER BY id")).scalars().all()
+    assert documents == [
+        FIELD_SEPARATOR.join(["brembo pad", "pn 001", "", "brake", "", ""]),
+        FIELD_SEPARATOR.join(["engine oil", "", "", "engine", "", ""]),
+    ]
+
+    # A second run must not touch rows that are already up to date
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE products SET search_document = 'kept' WHERE id = 1"))
+    run_migrations(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT search_document FROM products WHERE id = 1")).scalar() == "kept"
+    engine.dispose()
+
+
+# ----------------------------------------------------------------------
+# Routes
+# ----------------------------------------------------------------------
+
+def test_update_recomputes_search_document(client, db):
+    response = client.post("/products", json={"product_name": "Brake pad", "brand": "Bosch"})
+    product_id = response.json()["id"]
+
+    assert client.put(f"/products/{product_id}", json={"brand": "Brémbo"}).status_code == 200
+
+    db.expire_all()
+    document = db.query(Product).filter(Product.id == product_id).one().search_document
+    assert document == build_search_document(make_product(product_name="Brake pad", brand="Brembo"))
+    assert names(client.get("/products/search", params={"query": "brembo", "use_smart": "false"})) == ["Brake pad"]
+    assert names(client.get("/products/search", params={"query": "bosch", "use_smart": "false"})) == []
+
+
+def test_plain_search_includes_description_and_normalizes_punctuation(client):
+    client.post("/products", json={"product_name": "Disc pad", "part_number": "PN 001"})
+    client.post("/products", json={"product_name": "Engine oil", "description": "Fully synthetic 10W-40"})
+
+    plain = {"use_smart": "false"}
+    assert names(client.get("/products/search", params={**plain, "query": "synthetic"})) == ["Engine oil"]
+    assert names(client.get("/products/search", params={**plain, "query": "pn-001"})) == ["Disc pad"]
+    assert names(client.get("/products/search", params={**plain, "query": "10w 40"})) == ["Engine oil"]
+
+
+def test_punctuation_only_query_falls_back_to_raw_columns(client):
+    client.post("/products", json={"product_name": "Disc pad", "part_number": "PN-001"})
+    client.post("/products", json={"product_name": "Engine oil"})
+
+    assert names(client.get("/products/search", params={"query": "-", "use_smart": "false"})) == ["Disc pad"]
+
+
+def test_smart_search_tolerates_products_with_no_search_text(client):
+    client.post("/products", json={"product_name": "---"})
+    client.post("/products", json={"product_name": "Brake pad"})
+
+    assert names(client.get("/products/search", params={"query": "stopping"})) == ["Brake pad"]